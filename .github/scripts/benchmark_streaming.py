@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Streaming Decoder Benchmark
+
+Compares decoding a commit-heavy API page with response.json() against the
+streaming decoder and field projection used by generate_summary.py. Pages are
+synthetic but shaped like the list-commits endpoint (no ``files`` or ``stats``,
+which only the single-commit endpoint returns), so no token or network access
+is needed.
+
+The trade-off is memory for time. Streaming and projecting keeps only the
+summary fields, so peak memory falls (about 4x on a full 100-commit page). Parse
+time goes up by roughly 30-50%, because json.loads decodes the whole page in C
+while the streaming loop does per-element work in Python. Parse time does not fall.
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from generate_summary import COMMIT_FIELDS, STREAM_CHUNK_SIZE, _iter_json_array, _project
+
+
+def _make_commit(index: int) -> Dict:
+    """Build a list-commits entry with the bulky fields the real API returns"""
+    def url(kind: str) -> str:
+        return f"https://api.github.com/repos/owner/repo/{kind}/{index:040d}"
+
+    person = {
+        "login": "someone",
+        "id": 1,
+        "node_id": "MDQ6VXNlcjE=",
+        "avatar_url": url("avatar"),
+        "gravatar_id": "",
+        **{f"{kind}_url": url(kind) for kind in [
+            "html", "followers", "following", "gists", "starred",
+            "subscriptions", "organizations", "repos", "events", "received_events"
+        ]},
+        "type": "User",
+        "site_admin": False
+    }
+    signature = {"name": "Someone", "email": "someone@example.com", "date": "2026-10-10T10:00:00Z"}
+
+    return {
+        "sha": f"{index:040d}",
+        "node_id": "C_kwDO" + "x" * 40,
+        "commit": {
+            "author": signature,
+            "committer": signature,
+            "message": "Fix things\n\n" + "Body line\n" * 20,
+            "tree": {"sha": "t" * 40, "url": url("trees")},
+            "url": url("git/commits"),
+            "comment_count": 0,
+            "verification": {
+                "verified": True,
+                "reason": "valid",
+                "signature": "-----BEGIN PGP SIGNATURE-----\n" + "A" * 800 + "\n-----END PGP SIGNATURE-----",
+                "payload": "tree x\nparent y\n" * 10,
+                "verified_at": "2026-10-10T10:00:00Z"
+            }
+        },
+        "url": url("commits"),
+        "html_url": url("commit"),
+        "comments_url": url("comments"),
+        "author": person,
+        "committer": person,
+        "parents": [{"sha": "p" * 40, "url": url("parents"), "html_url": url("parent")}]
+    }
+
+
+def _measure(decode: Callable[[], List[Dict]], repeat: int) -> Dict[str, float]:
+    """Peak traced memory of one decode and mean wall time over ``repeat`` decodes"""
+    tracemalloc.start()
+    decode()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        decode()
+    elapsed = (time.perf_counter() - started) / repeat
+
+    return {"peak_kib": peak / 1024, "time_ms": elapsed * 1000}
+
+
+def main():
+    """Run the benchmark for a few page sizes"""
+    repeat = int(os.getenv("BENCHMARK_REPEAT", "20"))
+
+    for per_page in (30, 100):
+        body = json.dumps([_make_commit(index) for index in range(per_page)]).encode("utf-8")
+
+        def full_decode() -> List[Dict]:
+            return json.loads(body.decode("utf-8"))
+
+        def streamed_decode() -> List[Dict]:
+            chunks = (body[i:i + STREAM_CHUNK_SIZE] for i in range(0, len(body), STREAM_CHUNK_SIZE))
+            return [_project(record, COMMIT_FIELDS) for record in _iter_json_array(chunks)]
+
+        print(f"📦 {per_page} commits: {len(body) / 1024:.0f} KiB page")
+        for name, decode in (("response.json()", full_decode), ("streamed + projected", streamed_decode)):
+            result = _measure(decode, repeat)
+            print(f"   {name:22s} peak {result['peak_kib']:7.0f} KiB   {result['time_ms']:6.1f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
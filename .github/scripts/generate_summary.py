@@ -6,19 +6,494 @@ This script connects to GitHub's API to gather repository activity from the last
 and generates a summary of changes, commits, pull requests, and issues.
 """
 
+import codecs
+from abc import ABC, abstractmethod
+import fnmatch
+import heapq
+import json
 import os
 import re
 import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
 
 
+# Chunk size used when streaming list responses from the API
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Field projections per list endpoint: True keeps a value as-is, a dict keeps only the
+# listed sub-fields. Everything else is dropped as soon as a record has been decoded.
+COMMIT_FIELDS = {
+    "sha": True,
+    "html_url": True,
+    "commit": {"message": True, "author": {"name": True, "date": True}}
+}
+PULL_REQUEST_FIELDS = {"number": True, "title": True, "state": True, "updated_at": True, "merged_at": True}
+ISSUE_FIELDS = {"number": True, "title": True, "state": True, "updated_at": True, "pull_request": {}}
+RELEASE_FIELDS = {"name": True, "tag_name": True, "published_at": True}
+REPOSITORY_FIELDS = {
+    "name": True,
+    "full_name": True,
+    "owner": {"login": True},
+    "description": True,
+    "html_url": True,
+    "stargazers_count": True,
+    "forks_count": True,
+    "archived": True,
+    "private": True,
+    "visibility": True,
+    "fork": True,
+    "topics": True,
+    "pushed_at": True
+}
+STARRED_FIELDS = {
+    "starred_at": True,
+    "repo": {"name": True, "full_name": True, "html_url": True, "description": True, "owner": {"login": True}}
+}
+
+
+def _project(value: Any, fields: Dict[str, Any]) -> Any:
+    """Reduce a decoded JSON object to the declared field projection"""
+    if not isinstance(value, dict):
+        return value
+    projected = {}
+    for key, sub_fields in fields.items():
+        if key in value:
+            projected[key] = value[key] if sub_fields is True else _project(value[key], sub_fields)
+    return projected
+
+
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_JSON_SCALAR_END = re.compile(r'[ \t\n\r,\]]')
+
+
+def _iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Incrementally decode a top-level JSON array, yielding one element at a time
+    
+    Only the undecoded tail of the stream and the element being read are held in
+    memory, instead of the full page and its object tree. An element that spans
+    several chunks is only re-decoded once its buffered text has doubled, which
+    keeps the total decoding work linear in the element size.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    exhausted = False
+    # What may come next: "open" ("["), "first" (element or "]"),
+    # "element" (after a comma) or "separator" ("," or "]")
+    expect = "open"
+    # Buffered length of the current element at its last failed decode attempt
+    attempted = 0
+    
+    while True:
+        pos = _JSON_WHITESPACE.match(buffer, pos).end()
+        
+        if pos < len(buffer):
+            char = buffer[pos]
+            if expect == "open":
+                if char != "[":
+                    raise ValueError("Expected a JSON array response")
+                pos += 1
+                expect = "first"
+                continue
+            if expect == "separator":
+                if char == "]":
+                    return
+                if char != ",":
+                    raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+                pos += 1
+                expect = "element"
+                continue
+            if char == "]" and expect == "first":
+                return
+            
+            if char in '[{"':
+                # Containers and strings are self-delimiting
+                scalar_end = None
+                ready = exhausted or len(buffer) - pos >= 2 * attempted
+            else:
+                # Numbers and literals end at the next delimiter
+                match = _JSON_SCALAR_END.search(buffer, pos)
+                scalar_end = match.start() if match else len(buffer)
+                ready = exhausted or match is not None
+            
+            if ready:
+                try:
+                    element, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if exhausted:
+                        raise
+                    attempted = len(buffer) - pos
+                else:
+                    if scalar_end is not None and end != scalar_end:
+                        raise ValueError(f"Invalid JSON array element at offset {pos}")
+                    yield element
+                    pos = end
+                    attempted = 0
+                    expect = "separator"
+                    continue
+        
+        if exhausted:
+            raise ValueError("Unexpected end of JSON array")
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            text = text_decoder.decode(b"", final=True)
+        else:
+            text = text_decoder.decode(chunk)
+        # Drop consumed input once; a partially received element then grows in place
+        if pos:
+            buffer = buffer[pos:]
+            pos = 0
+        buffer += text
+
+
+def _commit_date(commit: Dict) -> str:
+    """Return the author date string used to order commits"""
+    return commit.get("commit", {}).get("author", {}).get("date", "")
+
+
+class CommitActivity:
+    """Bounded commit aggregate folded from per-repository commit lists
+    
+    Each repository's commits are folded in as soon as they are fetched, after
+    which the caller can drop the list: only the commit count, the author set
+    and the newest ``per_repo_limit`` commits of each repository are kept. With
+    ``repo_limit`` set, only the repositories with the most recent commits are
+    kept, and all totals describe just those repositories.
+    """
+    
+    def __init__(self, per_repo_limit: int = 3, repo_limit: Optional[int] = None,
+                 repo_info: Optional[Callable[[str], Dict[str, Any]]] = None):
+        self.per_repo_limit = per_repo_limit
+        self.repo_limit = repo_limit
+        self.repo_info = repo_info or (lambda full_name: {})
+        self.repositories: Dict[str, Dict[str, Any]] = {}
+    
+    def add_repository(self, repo: str, commits: List[Dict]):
+        """Fold one repository's commits into the aggregate"""
+        if not commits:
+            return
+        
+        # Bounded selection of the newest commits, no full sort needed
+        latest_commits = heapq.nlargest(self.per_repo_limit, commits, key=_commit_date)
+        self.repositories[repo] = {
+            "info": self.repo_info(repo),
+            "commit_count": len(commits),
+            "authors": {commit.get("commit", {}).get("author", {}).get("name", "Unknown") for commit in commits},
+            "latest_commit_at": _commit_date(latest_commits[0]),
+            "latest_commits": latest_commits
+        }
+        
+        # Evict the least recently active repository once over the limit
+        if self.repo_limit is not None and len(self.repositories) > self.repo_limit:
+            oldest = min(self.repositories, key=lambda name: self.repositories[name]["latest_commit_at"])
+            del self.repositories[oldest]
+    
+    def is_settled(self, pushed_at: str) -> bool:
+        """Whether a repository last pushed at ``pushed_at`` can no longer enter the kept repositories"""
+        if self.repo_limit is None or len(self.repositories) < self.repo_limit:
+            return False
+        return min(entry["latest_commit_at"] for entry in self.repositories.values()) >= pushed_at
+    
+    def ranked_repositories(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """(full_name, entry) pairs, most recently active repository first"""
+        return sorted(self.repositories.items(), key=lambda item: item[1]["latest_commit_at"], reverse=True)
+    
+    @property
+    def commit_count(self) -> int:
+        """Number of commits in the kept repositories"""
+        return sum(entry["commit_count"] for entry in self.repositories.values())
+    
+    @property
+    def authors(self) -> set:
+        """Commit authors across the kept repositories"""
+        return set().union(*(entry["authors"] for entry in self.repositories.values()))
+    
+    @property
+    def repository_count(self) -> int:
+        """Number of kept repositories (only repositories with commits are kept)"""
+        return len(self.repositories)
+
+
+# Per-repository requests made by get_all_repositories_activity (commits, pulls, issues, releases)
+REQUESTS_PER_REPOSITORY = 4
+
+
+def _parse_list_env(value: Optional[str]) -> List[str]:
+    """Parse a quoted, comma-separated list (e.g., "repo1","repo2","repo3")"""
+    items = []
+    if not value:
+        return items
+    # Split by comma, then strip quotes and whitespace from each item
+    for item in value.split(","):
+        item = item.strip()
+        # Remove surrounding quotes if present
+        if item.startswith('"') and item.endswith('"'):
+            item = item[1:-1]
+        elif item.startswith("'") and item.endswith("'"):
+            item = item[1:-1]
+        if item:
+            items.append(item)
+    return items
+
+
+class RepositoryFilter:
+    """Repository selection applied to the repository listing before any activity is fetched
+    
+    Include/exclude patterns are matched against both the full name (owner/repo)
+    and the bare repository name. They are globs by default; prefix a pattern
+    with ``re:`` to use a regular expression instead.
+    """
+    
+    VISIBILITIES = ("all", "public", "private")
+    
+    def __init__(self, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None,
+                 include_forks: bool = True, required_topics: Optional[List[str]] = None,
+                 excluded_topics: Optional[List[str]] = None, visibility: str = "all"):
+        if visibility not in self.VISIBILITIES:
+            raise ValueError(f"Invalid repository visibility '{visibility}', expected one of: {', '.join(self.VISIBILITIES)}")
+        
+        self.include = [self._compile(pattern) for pattern in include or []]
+        self.exclude = [self._compile(pattern) for pattern in exclude or []]
+        self.include_forks = include_forks
+        self.required_topics = set(required_topics or [])
+        self.excluded_topics = set(excluded_topics or [])
+        self.visibility = visibility
+    
+    @classmethod
+    def from_env(cls) -> "RepositoryFilter":
+        """Build the filter from environment variables (BLACKLISTED_REPOS is treated as exclude patterns)"""
+        return cls(
+            include=_parse_list_env(os.getenv("INCLUDE_REPOS")),
+            exclude=_parse_list_env(os.getenv("EXCLUDE_REPOS")) + _parse_list_env(os.getenv("BLACKLISTED_REPOS")),
+            # Unset workflow variables arrive as empty strings, which mean the default
+            include_forks=(os.getenv("INCLUDE_FORKS") or "true").lower() == "true",
+            required_topics=_parse_list_env(os.getenv("REQUIRED_TOPICS")),
+            excluded_topics=_parse_list_env(os.getenv("EXCLUDED_TOPICS")),
+            visibility=(os.getenv("REPO_VISIBILITY") or "all").strip().lower()
+        )
+    
+    @staticmethod
+    def _compile(pattern: str) -> "re.Pattern":
+        """Compile a glob (default) or ``re:``-prefixed regular expression"""
+        try:
+            if pattern.startswith("re:"):
+                return re.compile(pattern[3:])
+            return re.compile(fnmatch.translate(pattern))
+        except re.error as e:
+            raise ValueError(f"Invalid repository pattern '{pattern}': {e}")
+    
+    def matches(self, repo: Dict) -> bool:
+        """Check whether a repository from the listing should be fetched"""
+        names = [repo.get("full_name", ""), repo.get("name", "")]
+        
+        def matches_any(patterns):
+            return any(pattern.fullmatch(name) for pattern in patterns for name in names if name)
+        
+        if self.include and not matches_any(self.include):
+            return False
+        if matches_any(self.exclude):
+            return False
+        if not self.include_forks and repo.get("fork", False):
+            return False
+        
+        is_private = repo.get("private", False)
+        if self.visibility == "public" and is_private:
+            return False
+        if self.visibility == "private" and not is_private:
+            return False
+        
+        topics = set(repo.get("topics") or [])
+        if self.required_topics and not self.required_topics <= topics:
+            return False
+        if topics & self.excluded_topics:
+            return False
+        
+        return True
+    
+    def apply(self, repos: List[Dict]) -> List[Dict]:
+        """Return the repositories selected for fetching, preserving listing order"""
+        return [repo for repo in repos if self.matches(repo)]
+
+
+# How long each cached repository field is trusted. pushed_at drives fetch
+# scheduling and is never served from the cache.
+METADATA_FIELD_TTLS = {
+    "name": timedelta(days=30),
+    "full_name": timedelta(days=30),
+    "owner": timedelta(days=30),
+    "html_url": timedelta(days=30),
+    "fork": timedelta(days=30),
+    "description": timedelta(days=7),
+    "topics": timedelta(days=7),
+    "archived": timedelta(days=1),
+    "private": timedelta(days=1),
+    "visibility": timedelta(days=1),
+    "stargazers_count": timedelta(days=1),
+    "forks_count": timedelta(days=1),
+    "pushed_at": timedelta(0)
+}
+
+# Fields needed to render repository overview totals
+OVERVIEW_FIELDS = ("stargazers_count", "forks_count")
+
+# How long the last repository listing may stand in for a new one
+LISTING_TTL = timedelta(days=1)
+
+
+class RepositoryMetadataCache:
+    """Repository metadata with per-field TTLs, optionally persisted as JSON between runs
+    
+    The repository listing refreshes every entry in bulk, single-repository
+    requests update their own entry, and ``lookup`` hands out one memoized
+    display record per repository to every consumer.
+    """
+    
+    def __init__(self, path: Optional[str] = None, field_ttls: Optional[Dict[str, timedelta]] = None):
+        self.path = path
+        self.field_ttls = field_ttls or METADATA_FIELD_TTLS
+        # full_name -> {"fields": {field: value}, "fetched_at": {field: iso timestamp}}
+        self.repositories: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Last bulk refresh from the listing endpoint
+        self.listing: Dict[str, Any] = {}
+        self._lookups: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        
+        if path:
+            self.load()
+    
+    def load(self):
+        """Load the persisted cache, starting empty if it is missing or unreadable"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.repositories = data.get("repositories", {})
+            self.listing = data.get("listing", {})
+            print(f"🗃️ Loaded metadata for {len(self.repositories)} repositories from {self.path}")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"   Warning: Ignoring unreadable metadata cache {self.path}: {e}")
+            self.repositories = {}
+            self.listing = {}
+    
+    def save(self):
+        """Persist the cache if anything changed since it was loaded"""
+        if not self.path or not self._dirty:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump({"repositories": self.repositories, "listing": self.listing}, f)
+            self._dirty = False
+        except OSError as e:
+            print(f"   Warning: Could not write metadata cache {self.path}: {e}")
+    
+    def update(self, repo: Dict, fetched_at: Optional[datetime] = None):
+        """Store the cacheable fields of a repository API object"""
+        full_name = repo.get("full_name")
+        if not full_name:
+            return
+        fetched_at_str = (fetched_at or datetime.now(timezone.utc)).isoformat()
+        entry = self.repositories.setdefault(full_name, {"fields": {}, "fetched_at": {}})
+        for field in self.field_ttls:
+            if field in repo:
+                entry["fields"][field] = repo[field]
+                entry["fetched_at"][field] = fetched_at_str
+        self._lookups.pop(full_name, None)
+        self._dirty = True
+    
+    def bulk_refresh(self, repos: List[Dict], include_private: bool, complete: bool = True):
+        """Refresh every repository from one listing response
+        
+        Every received repository is stored, but an incomplete listing never
+        replaces the last complete one.
+        """
+        now = datetime.now(timezone.utc)
+        for repo in repos:
+            self.update(repo, fetched_at=now)
+        if not complete:
+            return
+        self.listing = {
+            "fetched_at": now.isoformat(),
+            "include_private": include_private,
+            "full_names": [repo.get("full_name") for repo in repos if repo.get("full_name")]
+        }
+        self._dirty = True
+    
+    def _is_fresh(self, entry: Dict[str, Dict[str, Any]], field: str, now: datetime) -> bool:
+        fetched_at = entry["fetched_at"].get(field)
+        if field not in entry["fields"] or not fetched_at:
+            return False
+        return now - datetime.fromisoformat(fetched_at) < self.field_ttls.get(field, timedelta(0))
+    
+    def get_fresh(self, full_name: str, fields: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """Return the requested fields if all of them are fresh, otherwise None"""
+        entry = self.repositories.get(full_name)
+        if not entry:
+            return None
+        now = datetime.now(timezone.utc)
+        if not all(self._is_fresh(entry, field, now) for field in fields):
+            return None
+        return {field: entry["fields"][field] for field in fields}
+    
+    def lookup(self, full_name: str) -> Dict[str, Any]:
+        """Memoized display information for a repository (name, description, URL)"""
+        info = self._lookups.get(full_name)
+        if info is None:
+            fields = self.repositories.get(full_name, {}).get("fields", {})
+            info = self._lookups[full_name] = {
+                "name": fields.get("name") or full_name.split("/")[-1],
+                "full_name": full_name,
+                "description": fields.get("description") or "",
+                "html_url": fields.get("html_url") or f"https://github.com/{full_name}"
+            }
+        return info
+    
+    def listing_is_fresh(self, include_private: bool, fields: Iterable[str] = OVERVIEW_FIELDS) -> bool:
+        """Whether the last listing can stand in for a new one for the given fields"""
+        if not self.listing or self.listing.get("include_private") != include_private:
+            return False
+        # An empty or old listing is never trusted, whatever its per-repo fields say
+        full_names = self.listing.get("full_names") or []
+        fetched_at = self.listing.get("fetched_at")
+        if not full_names or not fetched_at:
+            return False
+        if datetime.now(timezone.utc) - datetime.fromisoformat(fetched_at) >= LISTING_TTL:
+            return False
+        return all(self.get_fresh(full_name, fields) is not None for full_name in full_names)
+    
+    def totals(self, full_names: Optional[List[str]] = None) -> Dict[str, int]:
+        """Star, fork and repository totals over the given repositories (default: the last listing)"""
+        if full_names is None:
+            full_names = self.listing.get("full_names", [])
+        total_stars = 0
+        total_forks = 0
+        for full_name in full_names:
+            fields = self.repositories.get(full_name, {}).get("fields", {})
+            total_stars += fields.get("stargazers_count") or 0
+            total_forks += fields.get("forks_count") or 0
+        return {
+            "stargazers_count": total_stars,
+            "forks_count": total_forks,
+            "total_repositories": len(full_names)
+        }
+
+
 class GitHubAPIClient:
     """GitHub REST API Client for repository analysis"""
     
-    def __init__(self, token: str, owner: str, repo: str):
+    def __init__(self, token: str, owner: str, repo: str,
+                 metadata: Optional[RepositoryMetadataCache] = None):
         self.token = token
         self.owner = owner
         self.repo = repo
@@ -28,29 +503,28 @@ class GitHubAPIClient:
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "GitHub-Weekly-Summary-Bot/1.0"
         }
+        # Shared by every fetch path; in-memory only unless a cache path was configured
+        self.metadata = metadata or RepositoryMetadataCache()
+        # Number of requests that failed, so callers can detect incomplete results
+        self.failed_requests = 0
+        # Whether the last repository listing received every page
+        self.listing_complete = False
         
     def get_repository_activity(self, days: int = 7) -> Dict[str, Any]:
         """Get repository activity for the last N days"""
-        now = datetime.utcnow()
-        since = (now - timedelta(days=days)).isoformat() + "Z"
+        # Timezone-aware so the date range serializes with an explicit UTC offset
+        now = datetime.now(timezone.utc)
         since_date = now - timedelta(days=days)
+        since = since_date.isoformat().replace("+00:00", "Z")
         
         repo_info = self._get_repository_info()
         commits = self._get_commits(since)
         
-        # Add repo info to commits for consistency with multi-repo format
-        repo_full_name = f"{self.owner}/{self.repo}"
-        for commit in commits:
-            commit["_repo"] = repo_full_name
-            commit["_repo_info"] = {
-                "name": repo_info.get("name", self.repo) if repo_info else self.repo,
-                "full_name": repo_full_name,
-                "description": repo_info.get("description", "") if repo_info else "",
-                "html_url": repo_info.get("html_url", f"https://github.com/{repo_full_name}") if repo_info else f"https://github.com/{repo_full_name}"
-            }
+        commit_activity = CommitActivity(repo_info=self.metadata.lookup)
+        commit_activity.add_repository(f"{self.owner}/{self.repo}", commits)
         
         activity = {
-            "commits": commits,
+            "commit_activity": commit_activity,
             "pull_requests": self._get_pull_requests(since),
             "issues": self._get_issues(since),
             "releases": self._get_releases(since),
@@ -72,8 +546,27 @@ class GitHubAPIClient:
             return response.json()
         except requests.RequestException as e:
             print(f"Error making request to {endpoint}: {e}")
+            self.failed_requests += 1
             return None
     
+    def _iter_request(self, endpoint: str, params: Optional[Dict] = None,
+                      fields: Optional[Dict[str, Any]] = None,
+                      headers: Optional[Dict[str, str]] = None) -> Iterator[Dict]:
+        """Stream a list endpoint, yielding records reduced to the ``fields`` projection
+        
+        The response body is decoded incrementally, so the full page is never
+        materialized as one object tree.
+        """
+        try:
+            url = f"{self.base_url}{endpoint}"
+            with requests.get(url, headers=headers or self.headers, params=params or {}, stream=True) as response:
+                response.raise_for_status()
+                for record in _iter_json_array(response.iter_content(chunk_size=STREAM_CHUNK_SIZE)):
+                    yield _project(record, fields) if fields else record
+        except (requests.RequestException, ValueError) as e:
+            print(f"Error making request to {endpoint}: {e}")
+            self.failed_requests += 1
+    
     def _get_commits(self, since: str) -> List[Dict]:
         """Get commits since specified date"""
         return self._get_commits_for_repo(self.owner, self.repo, since)
@@ -81,10 +574,7 @@ class GitHubAPIClient:
     def _get_commits_for_repo(self, owner: str, repo: str, since: str) -> List[Dict]:
         """Get commits for a specific repository since specified date"""
         params = {"since": since, "per_page": 100}
-        commits = self._make_request(f"/repos/{owner}/{repo}/commits", params)
-        
-        if not commits:
-            return []
+        commits = self._iter_request(f"/repos/{owner}/{repo}/commits", params, fields=COMMIT_FIELDS)
         
         # Filter commits to ensure they're within the date range (since to now)
         # GitHub API might return commits slightly outside the range
@@ -116,11 +606,8 @@ class GitHubAPIClient:
     def _get_pull_requests_for_repo(self, owner: str, repo: str, since: str) -> List[Dict]:
         """Get pull requests for a specific repository updated since specified date"""
         params = {"state": "all", "sort": "updated", "direction": "desc", "per_page": 100}
-        prs = self._make_request(f"/repos/{owner}/{repo}/pulls", params)
+        prs = self._iter_request(f"/repos/{owner}/{repo}/pulls", params, fields=PULL_REQUEST_FIELDS)
         
-        if not prs:
-            return []
-            
         # Filter PRs updated since the specified date
         since_date = datetime.fromisoformat(since.replace("Z", "+00:00"))
         filtered_prs = []
@@ -139,13 +626,10 @@ class GitHubAPIClient:
     def _get_issues_for_repo(self, owner: str, repo: str, since: str) -> List[Dict]:
         """Get issues for a specific repository updated since specified date"""
         params = {"state": "all", "sort": "updated", "direction": "desc", "since": since, "per_page": 100}
-        issues = self._make_request(f"/repos/{owner}/{repo}/issues", params)
+        issues = self._iter_request(f"/repos/{owner}/{repo}/issues", params, fields=ISSUE_FIELDS)
         
         # Filter out pull requests (GitHub API includes PRs in issues)
-        if issues:
-            issues = [issue for issue in issues if "pull_request" not in issue]
-            
-        return issues or []
+        return [issue for issue in issues if "pull_request" not in issue]
     
     def _get_releases(self, since: str) -> List[Dict]:
         """Get releases published since specified date"""
@@ -153,11 +637,8 @@ class GitHubAPIClient:
     
     def _get_releases_for_repo(self, owner: str, repo: str, since: str) -> List[Dict]:
         """Get releases for a specific repository published since specified date"""
-        releases = self._make_request(f"/repos/{owner}/{repo}/releases")
+        releases = self._iter_request(f"/repos/{owner}/{repo}/releases", fields=RELEASE_FIELDS)
         
-        if not releases:
-            return []
-            
         since_date = datetime.fromisoformat(since.replace("Z", "+00:00"))
         filtered_releases = []
         
@@ -171,8 +652,16 @@ class GitHubAPIClient:
         return filtered_releases
     
     def _get_repository_info(self) -> Optional[Dict]:
-        """Get basic repository information"""
-        return self._make_request(f"/repos/{self.owner}/{self.repo}")
+        """Get basic repository information, served from the metadata cache while fresh"""
+        full_name = f"{self.owner}/{self.repo}"
+        cached = self.metadata.get_fresh(full_name, ("name", "description", "html_url") + OVERVIEW_FIELDS)
+        if cached is not None:
+            return {"full_name": full_name, **cached}
+        
+        repo_info = self._make_request(f"/repos/{full_name}")
+        if repo_info:
+            self.metadata.update(repo_info)
+        return repo_info
     
     def _get_starred_repositories(self, days: int = 30) -> List[Dict]:
         """Get repositories starred by the user in the last N days
@@ -206,55 +695,44 @@ class GitHubAPIClient:
                 "page": page
             }
             
-            try:
-                url = f"{self.base_url}/user/starred"
-                response = requests.get(url, headers=headers_with_star, params=params)
-                response.raise_for_status()
-                repos = response.json()
-                
-                if not repos or not isinstance(repos, list):
-                    break
-                
-                # Filter repos by starred_at date
-                # Note: sort=created sorts by repo creation date, not starred date,
-                # so we need to check all repos and filter by starred_at
-                for item in repos:
-                    starred_at_str = item.get("starred_at")
-                    repo_data = item.get("repo", {})
-                    
-                    if starred_at_str:
-                        try:
-                            starred_at = datetime.fromisoformat(starred_at_str.replace("Z", "+00:00"))
-                            if starred_at >= since_date:
-                                # Extract only the needed fields from the repo object
-                                extracted_repo = {
-                                    "starred_at": starred_at_str,
-                                    "name": repo_data.get("name", ""),
-                                    "full_name": repo_data.get("full_name", ""),
-                                    "html_url": repo_data.get("html_url", ""),
-                                    "description": repo_data.get("description", ""),
-                                    "owner": repo_data.get("owner", {})
-                                }
-                                starred_repos.append(extracted_repo)
-                            # Continue checking all repos since sort is by creation date, not starred date
-                        except (ValueError, AttributeError) as e:
-                            # If date parsing fails, skip this repo
-                            print(f"   Warning: Could not parse starred_at date: {e}")
-                            continue
-                    # If no starred_at field, skip this repo
-                    # This shouldn't happen with the star+json header, but handle it gracefully
+            # Filter repos by starred_at date
+            # Note: sort=created sorts by repo creation date, not starred date,
+            # so we need to check all repos and filter by starred_at
+            page_count = 0
+            for item in self._iter_request("/user/starred", params, fields=STARRED_FIELDS, headers=headers_with_star):
+                page_count += 1
+                starred_at_str = item.get("starred_at")
+                repo_data = item.get("repo") or {}
                 
-                # If we got fewer results than per_page, we're done
-                if len(repos) < per_page:
-                    break
-                
-                # Continue to next page to check all starred repos
-                # We can't stop early since sorting is by creation date, not starred date
-                page += 1
-                
-            except requests.RequestException as e:
-                print(f"   Error fetching starred repositories: {e}")
+                if starred_at_str:
+                    try:
+                        starred_at = datetime.fromisoformat(starred_at_str.replace("Z", "+00:00"))
+                        if starred_at >= since_date:
+                            # Extract only the needed fields from the repo object
+                            extracted_repo = {
+                                "starred_at": starred_at_str,
+                                "name": repo_data.get("name", ""),
+                                "full_name": repo_data.get("full_name", ""),
+                                "html_url": repo_data.get("html_url", ""),
+                                "description": repo_data.get("description", ""),
+                                "owner": repo_data.get("owner", {})
+                            }
+                            starred_repos.append(extracted_repo)
+                        # Continue checking all repos since sort is by creation date, not starred date
+                    except (ValueError, AttributeError) as e:
+                        # If date parsing fails, skip this repo
+                        print(f"   Warning: Could not parse starred_at date: {e}")
+                        continue
+                # If no starred_at field, skip this repo
+                # This shouldn't happen with the star+json header, but handle it gracefully
+            
+            # If we got fewer results than per_page (or the request failed), we're done
+            if page_count < per_page:
                 break
+            
+            # Continue to next page to check all starred repos
+            # We can't stop early since sorting is by creation date, not starred date
+            page += 1
         
         # Sort by starred_at date (most recent first)
         starred_repos.sort(
@@ -274,54 +752,129 @@ class GitHubAPIClient:
         repos = []
         page = 1
         per_page = 100
+        failed_before = self.failed_requests
         
         while True:
             params = {
                 "affiliation": "owner",  # Only repos owned by the user
-                "sort": "updated",
+                "sort": "pushed",
                 "direction": "desc",
                 "per_page": per_page,
                 "page": page
             }
             
-            response_data = self._make_request("/user/repos", params)
-            if not response_data:
-                break
-                
+            page_count = 0
+            
             # Filter out archived repos and optionally private repos
-            for repo in response_data:
+            for repo in self._iter_request("/user/repos", params, fields=REPOSITORY_FIELDS):
+                page_count += 1
                 if not repo.get("archived", False):
                     if include_private or not repo.get("private", False):
                         repos.append(repo)
             
-            # Check if we got fewer results than per_page (last page)
-            if len(response_data) < per_page:
+            # Check if we got fewer results than per_page (last page or failed request)
+            if page_count < per_page:
                 break
                 
             page += 1
         
+        # Cache what did arrive, but never let a failed or partial listing replace the last complete one
+        self.listing_complete = self.failed_requests == failed_before
+        if not self.listing_complete:
+            print("   Warning: Repository listing incomplete, keeping the previous repository listing")
+        self.metadata.bulk_refresh(repos, include_private=include_private, complete=self.listing_complete)
         return repos
     
-    def get_all_repositories_activity(self, days: int = 7, include_private: bool = True) -> Dict[str, Any]:
-        """Get aggregated activity across all repositories for the last N days"""
-        now = datetime.utcnow()
-        since = (now - timedelta(days=days)).isoformat() + "Z"
+    def _listing_totals_names(self, repos: List[Dict], include_private: bool) -> Optional[List[str]]:
+        """Repositories the overview totals should cover after a listing
+        
+        A complete listing covers itself. After an incomplete one, a fresh cached
+        listing is preferred, then whatever repositories did arrive.
+        """
+        if not self.listing_complete and self.metadata.listing_is_fresh(include_private):
+            return None
+        return [repo["full_name"] for repo in repos if repo.get("full_name")]
+    
+    def _aggregate_repository_info(self, full_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Aggregated overview of the owner's repositories from the metadata cache"""
+        totals = self.metadata.totals(full_names)
+        return {
+            "name": f"{self.owner}'s repositories",
+            "description": f"Aggregated activity across {totals['total_repositories']} repositories",
+            **totals
+        }
+    
+    def get_repository_overview(self, include_private: bool = True) -> Dict[str, Any]:
+        """Get overview totals, skipping the repository listing while the cache is fresh
+        
+        Returns an empty dict when the listing is incomplete and no fresh cached
+        listing exists, so partial totals are never published.
+        """
+        if self.metadata.listing_is_fresh(include_private):
+            print("🗃️ Using cached repository metadata for overview totals")
+            return self._aggregate_repository_info()
+        
+        print(f"📦 Fetching all repositories for {self.owner}...")
+        self._get_all_repositories(include_private=include_private)
+        if not self.listing_complete:
+            print("⚠️ Repository listing incomplete and no fresh cached listing, skipping overview totals")
+            return {}
+        return self._aggregate_repository_info()
+    
+    def get_all_repositories_activity(self, days: int = 7, include_private: bool = True,
+                                      repo_filter: Optional[RepositoryFilter] = None,
+                                      max_active_repos: Optional[int] = None) -> Dict[str, Any]:
+        """Get aggregated activity across all repositories for the last N days
+        
+        Repositories rejected by ``repo_filter`` are dropped from the listing before
+        any per-repository request is made. The rest are fetched most recently
+        pushed first; with ``max_active_repos`` set, fetching stops as soon as no
+        remaining repository can displace the top N most recently active ones
+        (a commit is assumed not to be newer than the repository's last push).
+        Commit totals then describe only those top N repositories.
+        """
+        # Timezone-aware so the date range serializes with an explicit UTC offset
+        now = datetime.now(timezone.utc)
         since_date = now - timedelta(days=days)
+        since = since_date.isoformat().replace("+00:00", "Z")
         
         print(f"📦 Fetching all repositories for {self.owner}...")
         all_repos = self._get_all_repositories(include_private=include_private)
         print(f"   Found {len(all_repos)} repositories")
         
-        all_commits = []
+        # Plan the fetch: filtered repositories never cost an API request
+        selected_repos = repo_filter.apply(all_repos) if repo_filter else all_repos
+        skipped_count = len(all_repos) - len(selected_repos)
+        fetch_plan = {
+            "listed_repositories": len(all_repos),
+            "selected_repositories": len(selected_repos),
+            "skipped_repositories": skipped_count,
+            "requests_saved": skipped_count * REQUESTS_PER_REPOSITORY
+        }
+        if skipped_count:
+            print(f"🧹 Repository filters skipped {skipped_count} repositories "
+                  f"({fetch_plan['requests_saved']} API requests saved)")
+        
+        # Most likely active repositories first
+        selected_repos = sorted(selected_repos, key=lambda r: r.get("pushed_at") or "", reverse=True)
+        
+        commit_activity = CommitActivity(repo_limit=max_active_repos, repo_info=self.metadata.lookup)
         all_prs = []
         all_issues = []
         all_releases = []
-        total_stars = 0
-        total_forks = 0
+        fetched_count = 0
         
-        for idx, repo in enumerate(all_repos, 1):
+        for idx, repo in enumerate(selected_repos, 1):
+            # Stop once the Nth most recent repo is newer than anything left to fetch
+            if commit_activity.is_settled(repo.get("pushed_at") or ""):
+                remaining = len(selected_repos) - fetched_count
+                print(f"⏹️ Top {max_active_repos} active repositories determined, "
+                      f"skipping {remaining} less recently pushed repositories")
+                break
+            fetched_count += 1
+            
             repo_name = repo.get("full_name", "unknown")
-            print(f"   [{idx}/{len(all_repos)}] Checking {repo_name}...")
+            print(f"   [{idx}/{len(selected_repos)}] Checking {repo_name}...")
             
             # Get owner and repo name for this repository
             repo_owner = repo.get("owner", {}).get("login", self.owner)
@@ -334,15 +887,10 @@ class GitHubAPIClient:
             issues = self._get_issues_for_repo(repo_owner, repo_name_only, since)
             releases = self._get_releases_for_repo(repo_owner, repo_name_only, since)
             
-            # Add repo info to commits for tracking
-            for commit in commits:
-                commit["_repo"] = repo_name
-                commit["_repo_info"] = {
-                    "name": repo.get("name", repo_name_only),
-                    "full_name": repo_name,
-                    "description": repo.get("description", ""),
-                    "html_url": repo.get("html_url", "")
-                }
+            # Fold commits right away so only the bounded aggregate outlives this iteration;
+            # display info comes from the metadata cache
+            commit_activity.add_repository(repo_name, commits)
+            
             for pr in prs:
                 pr["_repo"] = repo_name
             for issue in issues:
@@ -350,32 +898,25 @@ class GitHubAPIClient:
             for release in releases:
                 release["_repo"] = repo_name
             
-            all_commits.extend(commits)
             all_prs.extend(prs)
             all_issues.extend(issues)
             all_releases.extend(releases)
-            
-            total_stars += repo.get("stargazers_count", 0)
-            total_forks += repo.get("forks_count", 0)
         
-        # Sort commits by date (most recent first)
-        all_commits.sort(key=lambda x: x.get("commit", {}).get("author", {}).get("date", ""), reverse=True)
+        unfetched_count = len(selected_repos) - fetched_count
+        fetch_plan["fetched_repositories"] = fetched_count
+        fetch_plan["short_circuited_repositories"] = unfetched_count
+        fetch_plan["requests_saved"] += unfetched_count * REQUESTS_PER_REPOSITORY
         
-        # Aggregate repository info
-        aggregated_info = {
-            "name": f"{self.owner}'s repositories",
-            "description": f"Aggregated activity across {len(all_repos)} repositories",
-            "stargazers_count": total_stars,
-            "forks_count": total_forks,
-            "total_repositories": len(all_repos)
-        }
+        # Community totals cover every listed repository, not just the fetched ones
+        aggregated_info = self._aggregate_repository_info(self._listing_totals_names(all_repos, include_private))
         
         return {
-            "commits": all_commits,
+            "commit_activity": commit_activity,
             "pull_requests": all_prs,
             "issues": all_issues,
             "releases": all_releases,
             "repository_info": aggregated_info,
+            "fetch_plan": fetch_plan,
             "date_range": {
                 "since": since_date,
                 "until": now
@@ -389,27 +930,143 @@ class SummaryGenerator:
     def __init__(self, activity_data: Dict[str, Any], date_range: Optional[Dict[str, datetime]] = None):
         self.activity = activity_data
         self.date_range = date_range or {}
+        self._model = None
+    
+    def build_model(self) -> Dict[str, Any]:
+        """Aggregate the activity data once into the model shared by every output sink"""
+        if self._model is None:
+            # Overview-only runs carry no commit activity at all
+            commit_activity = self.activity.get("commit_activity")
+            self._model = {
+                "generated_at": datetime.now(timezone.utc),
+                "date_range": self.date_range,
+                "repository_info": self.activity.get("repository_info") or {},
+                "fetch_plan": self.activity.get("fetch_plan"),
+                "commits": self._build_commits_model(commit_activity) if commit_activity is not None else None,
+                "starred": self._build_starred_model(self.activity.get("starred_repositories", []))
+            }
+        return self._model
         
+    def generate_overview(self) -> str:
+        """Generate only the Community overview line (empty without repository info)"""
+        repo_info = self.build_model()["repository_info"]
+        return self._format_repository_overview(repo_info) if repo_info else ""
+    
     def generate_weekly_summary(self) -> str:
         """Generate a weekly summary matching the current README.md format"""
+        model = self.build_model()
         summary_parts = []
         
         # Repository overview - always include this
-        repo_info = self.activity.get("repository_info", {})
+        repo_info = model["repository_info"]
         if repo_info:
             summary_parts.append(self._format_repository_overview(repo_info))
         
-        # Commits summary - always include this  
-        commits = self.activity.get("commits", [])
-        summary_parts.append(self._format_commits_summary(commits))
+        # Commits summary - included whenever activity was fetched
+        if model["commits"] is not None:
+            summary_parts.append(self._format_commits_summary(model["commits"]))
         
         # Starred repositories summary - always include this
-        starred_repos = self.activity.get("starred_repositories", [])
-        if starred_repos:
-            summary_parts.append(self._format_starred_repositories_summary(starred_repos))
+        if model["starred"]["count"]:
+            summary_parts.append(self._format_starred_repositories_summary(model["starred"]))
         
         return "## Weekly Summary\n\n" + "\n\n".join(summary_parts)
     
+    def _build_commits_model(self, commit_activity: CommitActivity) -> Dict[str, Any]:
+        """Group commit activity into per-repository entries with cleaned-up messages"""
+        commits_model = {
+            "count": commit_activity.commit_count,
+            "authors": sorted(commit_activity.authors),
+            "repository_count": commit_activity.repository_count,
+            # Set when the totals only cover the N most recently active repositories
+            "repository_limit": commit_activity.repo_limit,
+            "repositories": []
+        }
+        
+        for repo_full_name, repo_entry in commit_activity.ranked_repositories():
+            repo_info = repo_entry["info"]
+            latest_commits = repo_entry["latest_commits"]
+            
+            messages = []
+            for commit in latest_commits:
+                message = commit.get("commit", {}).get("message", "").split('\n')[0]
+                # Clean up automated commit messages
+                if message.startswith("🤖"):
+                    message = message.replace("🤖 ", "").strip()
+                messages.append(message)
+            
+            commits_model["repositories"].append({
+                "full_name": repo_full_name,
+                "name": repo_info.get("name", repo_full_name.split("/")[-1]),
+                "description": repo_info.get("description") or "",
+                "html_url": repo_info.get("html_url") or "",
+                "commit_count": repo_entry["commit_count"],
+                "latest_commit_at": repo_entry["latest_commit_at"],
+                "messages": messages
+            })
+        
+        return commits_model
+    
+    def _build_starred_model(self, starred_repos: List[Dict], limit: int = 10) -> Dict[str, Any]:
+        """Normalize the most recently starred repositories into label/url entries"""
+        entries = []
+        for repo in starred_repos[:limit]:  # Show up to 10 most recently starred
+            # Get repository information from extracted data
+            full_name = repo.get("full_name", "")
+            description = repo.get("description", "")
+            html_url = repo.get("html_url", "")
+            repo_name = repo.get("name", "")
+            
+            # Get owner information for fallback
+            owner = repo.get("owner", {})
+            if isinstance(owner, dict):
+                owner_login = owner.get("login", "")
+            else:
+                owner_login = ""
+            
+            # Fallback: construct full_name from owner and name if not present
+            if not full_name:
+                if owner_login and repo_name:
+                    full_name = f"{owner_login}/{repo_name}"
+                elif repo_name:
+                    # If we only have name, try to get owner from other fields
+                    if isinstance(owner, str):
+                        full_name = f"{owner}/{repo_name}"
+            
+            # Fallback: construct html_url if not present
+            if not html_url:
+                if full_name:
+                    html_url = f"https://github.com/{full_name}"
+                elif repo_name and owner_login:
+                    html_url = f"https://github.com/{owner_login}/{repo_name}"
+            
+            # Pick the label and link shown for the repository
+            if html_url and full_name:
+                label = full_name
+            elif html_url and repo_name and owner_login:
+                # Fallback: use owner/repo_name if full_name not available
+                label = f"{owner_login}/{repo_name}"
+            elif full_name:
+                label, html_url = full_name, ""
+            elif repo_name and owner_login:
+                label = f"{owner_login}/{repo_name}"
+                html_url = f"https://github.com/{owner_login}/{repo_name}"
+            elif repo_name:
+                label, html_url = repo_name, ""
+            else:
+                # Last resort: print debug info and skip
+                print(f"   Warning: Could not extract repository info from starred repo. Keys: {list(repo.keys())}")
+                continue
+            
+            entries.append({
+                "label": label,
+                "html_url": html_url,
+                "description": description or "",
+                "starred_at": repo.get("starred_at", "")
+            })
+        
+        return {"count": len(starred_repos), "repositories": entries}
+    
     def _format_repository_overview(self, repo_info: Dict) -> str:
         """Format repository overview with professional styling"""
         name = repo_info.get("name", "Unknown")
@@ -426,27 +1083,22 @@ class SummaryGenerator:
         
         return overview
     
-    def _format_commits_summary(self, commits: List[Dict]) -> str:
+    def _format_commits_summary(self, commits_model: Dict[str, Any]) -> str:
         """Format commits summary with professional styling"""
-        commit_count = len(commits)
-        authors = set()
-        repos_with_commits = set()
-        
-        for commit in commits:
-            author = commit.get("commit", {}).get("author", {}).get("name", "Unknown")
-            authors.add(author)
-            repo = commit.get("_repo", "unknown")
-            if repo:
-                repos_with_commits.add(repo)
+        commit_count = commits_model["count"]
+        author_count = len(commits_model["authors"])
+        repo_count = commits_model["repository_count"]
         
         # Create a more professional header
-        contributor_text = "contributor" if len(authors) == 1 else "contributors"
+        contributor_text = "contributor" if author_count == 1 else "contributors"
         commit_text = "commit" if commit_count == 1 else "commits"
-        repo_text = "repository" if len(repos_with_commits) == 1 else "repositories"
+        repo_text = "repository" if repo_count == 1 else "repositories"
         
-        summary = f"**Recent Activity:** {commit_count} {commit_text} from {len(authors)} {contributor_text}"
-        if len(repos_with_commits) > 0:
-            summary += f" across {len(repos_with_commits)} {repo_text}"
+        summary = f"**Recent Activity:** {commit_count} {commit_text} from {author_count} {contributor_text}"
+        if repo_count > 0 and commits_model.get("repository_limit"):
+            summary += f" in the {repo_count} most recently active {repo_text}"
+        elif repo_count > 0:
+            summary += f" across {repo_count} {repo_text}"
         
         # Add date range if available
         if self.date_range:
@@ -458,68 +1110,24 @@ class SummaryGenerator:
                 summary += f"\n**Date Range:** {since_str} to {until_str}"
         
         if commit_count > 0:
-            # Read blacklisted repos from environment variable
-            blacklisted_repos_env = os.getenv("BLACKLISTED_REPOS")
-            if not blacklisted_repos_env:
-                raise ValueError("BLACKLISTED_REPOS environment variable is not defined. Summary generation stopped.")
-            
-            # Parse quoted, comma-separated list (e.g., "repo1","repo2","repo3")
-            blacklisted_repos = set()
-            # Split by comma, then strip quotes and whitespace from each item
-            for repo in blacklisted_repos_env.split(","):
-                repo = repo.strip()
-                # Remove surrounding quotes if present
-                if repo.startswith('"') and repo.endswith('"'):
-                    repo = repo[1:-1]
-                elif repo.startswith("'") and repo.endswith("'"):
-                    repo = repo[1:-1]
-                if repo:
-                    blacklisted_repos.add(repo)
-            
-            # Group all commits by repository (not just recent ones)
-            commits_by_repo = {}
-            for commit in commits:
-                repo = commit.get("_repo", "unknown")
-                # Skip blacklisted repositories
-                if repo in blacklisted_repos:
-                    continue
-                if repo not in commits_by_repo:
-                    commits_by_repo[repo] = []
-                commits_by_repo[repo].append(commit)
-            
             summary += "\n\n**Latest Changes:**"
             
             # Format commits grouped by repository
             repo_sections = []
-            for repo_full_name, repo_commits in commits_by_repo.items():
-                repo_info = repo_commits[0].get("_repo_info", {})
-                repo_name = repo_info.get("name", repo_full_name.split("/")[-1])
-                repo_description = repo_info.get("description", "")
-                repo_url = repo_info.get("html_url", "")
-                
-                # Get last 3 commits for this repo
-                last_3_commits = repo_commits[:3]
-                commit_messages = []
-                for commit in last_3_commits:
-                    message = commit.get("commit", {}).get("message", "").split('\n')[0]
-                    # Clean up automated commit messages
-                    if message.startswith("🤖"):
-                        message = message.replace("🤖 ", "").strip()
-                    commit_messages.append(message)
-                
+            for repo in commits_model["repositories"]:
                 # Create repo header with commits in brackets on the same line (using "-" instead of "###")
-                if repo_url:
-                    repo_header = f"\n- [{repo_name}]({repo_url})"
+                if repo["html_url"]:
+                    repo_header = f"\n- [{repo['name']}]({repo['html_url']})"
                 else:
-                    repo_header = f"\n- {repo_name}"
+                    repo_header = f"\n- {repo['name']}"
 
                 # Add description on a separate line if it exists
-                if repo_description:
-                    repo_header += f"\n{repo_description}"
+                if repo["description"]:
+                    repo_header += f"\n{repo['description']}"
                 
                 # Add commits in brackets on the same line as repo name
-                if commit_messages:
-                    commits_text = ", ".join(commit_messages)
+                if repo["messages"]:
+                    commits_text = ", ".join(repo["messages"])
                     repo_header += f" ({commits_text})"
     
                 repo_sections.append(repo_header)
@@ -579,65 +1187,24 @@ class SummaryGenerator:
         
         return summary
     
-    def _format_starred_repositories_summary(self, starred_repos: List[Dict]) -> str:
+    def _format_starred_repositories_summary(self, starred_model: Dict[str, Any]) -> str:
         """Format starred repositories summary"""
-        count = len(starred_repos)
+        count = starred_model["count"]
         repo_text = "repository" if count == 1 else "repositories"
         
         summary = f"**Recently Starred:** {count} {repo_text} in the past month"
         
-        if starred_repos:
-            for repo in starred_repos[:10]:  # Show up to 10 most recently starred
-                # Get repository information from extracted data
-                full_name = repo.get("full_name", "")
-                description = repo.get("description", "")
-                html_url = repo.get("html_url", "")
-                repo_name = repo.get("name", "")
-                
-                # Get owner information for fallback
-                owner = repo.get("owner", {})
-                if isinstance(owner, dict):
-                    owner_login = owner.get("login", "")
-                else:
-                    owner_login = ""
-                
-                # Fallback: construct full_name from owner and name if not present
-                if not full_name:
-                    if owner_login and repo_name:
-                        full_name = f"{owner_login}/{repo_name}"
-                    elif repo_name:
-                        # If we only have name, try to get owner from other fields
-                        if isinstance(owner, str):
-                            full_name = f"{owner}/{repo_name}"
-                
-                # Fallback: construct html_url if not present
-                if not html_url:
-                    if full_name:
-                        html_url = f"https://github.com/{full_name}"
-                    elif repo_name and owner_login:
-                        html_url = f"https://github.com/{owner_login}/{repo_name}"
-                
+        if count:
+            for repo in starred_model["repositories"]:
                 # Create the repository entry with proper markdown formatting
-                if html_url and full_name:
-                    repo_entry = f"\n- [{full_name}]({html_url})"
-                elif html_url and repo_name and owner_login:
-                    # Fallback: use owner/repo_name if full_name not available
-                    full_name_fallback = f"{owner_login}/{repo_name}"
-                    repo_entry = f"\n- [{full_name_fallback}]({html_url})"
-                elif full_name:
-                    repo_entry = f"\n- {full_name}"
-                elif repo_name and owner_login:
-                    repo_entry = f"\n- [{owner_login}/{repo_name}](https://github.com/{owner_login}/{repo_name})"
-                elif repo_name:
-                    repo_entry = f"\n- {repo_name}"
+                if repo["html_url"]:
+                    repo_entry = f"\n- [{repo['label']}]({repo['html_url']})"
                 else:
-                    # Last resort: print debug info and skip
-                    print(f"   Warning: Could not extract repository info from starred repo. Keys: {list(repo.keys())}")
-                    continue
+                    repo_entry = f"\n- {repo['label']}"
                 
                 # Add description if available
-                if description:
-                    repo_entry += f" - {description}"
+                if repo["description"]:
+                    repo_entry += f" - {repo['description']}"
                 
                 summary += repo_entry
         else:
@@ -646,22 +1213,27 @@ class SummaryGenerator:
         return summary
 
 
+def _resolve_readme_path(readme_path: str) -> str:
+    """Resolve absolute path to ensure we're working with the correct file"""
+    if os.path.isabs(readme_path):
+        return readme_path
+    
+    # Try to find README.md relative to script location or current working directory
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.dirname(os.path.dirname(script_dir))
+    potential_path = os.path.join(repo_root, readme_path)
+    
+    # Use repo root path if it exists, otherwise use current working directory
+    if os.path.exists(potential_path):
+        return potential_path
+    # Fallback to current working directory (for when script runs from repo root)
+    return os.path.abspath(readme_path)
+
+
 def update_readme_with_summary(summary: str, readme_path: str = "README.md"):
     """Update README.md with the weekly summary while preserving existing structure"""
     try:
-        # Resolve absolute path to ensure we're working with the correct file
-        if not os.path.isabs(readme_path):
-            # Try to find README.md relative to script location or current working directory
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            repo_root = os.path.dirname(os.path.dirname(script_dir))
-            potential_path = os.path.join(repo_root, readme_path)
-            
-            # Use repo root path if it exists, otherwise use current working directory
-            if os.path.exists(potential_path):
-                readme_path = potential_path
-            else:
-                # Fallback to current working directory (for when script runs from repo root)
-                readme_path = os.path.abspath(readme_path)
+        readme_path = _resolve_readme_path(readme_path)
         
         print(f"📝 Reading README from: {readme_path}")
         
@@ -721,6 +1293,187 @@ def update_readme_with_summary(summary: str, readme_path: str = "README.md"):
         sys.exit(1)
 
 
+def update_readme_overview(overview: str, readme_path: str = "README.md"):
+    """Replace only the Community line of README.md, leaving the rest of the summary intact"""
+    if not overview:
+        print("⚠️ No overview totals available, README.md left unchanged")
+        return
+    
+    readme_path = _resolve_readme_path(readme_path)
+    print(f"📝 Reading README from: {readme_path}")
+    try:
+        with open(readme_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        new_content, replaced = re.subn(r'^\*\*Community:\*\*.*$', lambda match: overview, content,
+                                        count=1, flags=re.MULTILINE)
+        if not replaced:
+            print("⚠️ Community line not found in README.md, leaving it unchanged")
+        elif new_content == content:
+            print("⚠️ Warning: Overview totals are identical to existing content")
+        else:
+            with open(readme_path, 'w', encoding='utf-8') as f:
+                f.write(new_content)
+            print(f"✅ README.md Community line updated at {readme_path}")
+    except OSError as e:
+        print(f"❌ Error updating README.md: {e}")
+        sys.exit(1)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the json module does not handle natively"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, set):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class SummarySink(ABC):
+    """Output target rendered from the shared activity model of a SummaryGenerator"""
+    
+    name = "sink"
+    
+    @abstractmethod
+    def render(self, summary_generator: SummaryGenerator) -> str:
+        """Render this sink's output from the generator's shared model"""
+    
+    @abstractmethod
+    def write(self, content: str):
+        """Persist the rendered output"""
+    
+    def emit(self, summary_generator: SummaryGenerator):
+        """Render and persist in one step"""
+        self.write(self.render(summary_generator))
+
+
+class FileSink(SummarySink):
+    """Sink that writes its rendered output to a file"""
+    
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+    
+    def write(self, content: str):
+        try:
+            directory = os.path.dirname(self.output_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.output_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            print(f"✅ Wrote {self.name} summary to {self.output_path}")
+        except OSError as e:
+            print(f"❌ Error writing {self.name} summary to {self.output_path}: {e}")
+            sys.exit(1)
+
+
+class MarkdownSink(SummarySink):
+    """Weekly Summary section spliced into README.md
+    
+    Overview-only runs update just the Community line so the activity and
+    starred sections from the last full run are kept.
+    """
+    
+    name = "markdown"
+    
+    def __init__(self, readme_path: str = "README.md", overview_only: bool = False):
+        self.readme_path = readme_path
+        self.overview_only = overview_only
+    
+    def render(self, summary_generator: SummaryGenerator) -> str:
+        if self.overview_only:
+            return summary_generator.generate_overview()
+        return summary_generator.generate_weekly_summary()
+    
+    def write(self, content: str):
+        if self.overview_only:
+            update_readme_overview(content, self.readme_path)
+        else:
+            update_readme_with_summary(content, self.readme_path)
+
+
+class JSONSink(FileSink):
+    """Machine-readable dump of the activity model for dashboards"""
+    
+    name = "json"
+    
+    def render(self, summary_generator: SummaryGenerator) -> str:
+        return json.dumps(summary_generator.build_model(), default=_json_default, ensure_ascii=False, indent=2)
+
+
+class AtomFeedSink(FileSink):
+    """Atom feed with one entry per repository that had recent commits"""
+    
+    name = "atom"
+    
+    def __init__(self, output_path: str, feed_id: str, author: str):
+        super().__init__(output_path)
+        self.feed_id = feed_id
+        self.author = author
+    
+    def render(self, summary_generator: SummaryGenerator) -> str:
+        model = summary_generator.build_model()
+        generated_at = model["generated_at"].isoformat()
+        
+        feed = ET.Element("feed", xmlns="http://www.w3.org/2005/Atom")
+        ET.SubElement(feed, "id").text = self.feed_id
+        ET.SubElement(feed, "title").text = f"Weekly Summary - {model['repository_info'].get('name', self.author)}"
+        ET.SubElement(feed, "updated").text = generated_at
+        ET.SubElement(ET.SubElement(feed, "author"), "name").text = self.author
+        ET.SubElement(feed, "link", href=self.feed_id)
+        
+        for repo in (model["commits"] or {}).get("repositories", []):
+            repo_url = repo["html_url"] or f"https://github.com/{repo['full_name']}"
+            commit_text = "commit" if repo["commit_count"] == 1 else "commits"
+            
+            entry = ET.SubElement(feed, "entry")
+            ET.SubElement(entry, "id").text = f"{repo_url}#{repo['latest_commit_at'] or generated_at}"
+            ET.SubElement(entry, "title").text = f"{repo['name']}: {repo['commit_count']} {commit_text}"
+            ET.SubElement(entry, "updated").text = repo["latest_commit_at"] or generated_at
+            ET.SubElement(entry, "link", href=repo_url)
+            summary = ", ".join(repo["messages"])
+            if repo["description"]:
+                summary = f"{repo['description']} ({summary})"
+            ET.SubElement(entry, "summary").text = summary
+        
+        return ET.tostring(feed, encoding="unicode", xml_declaration=True) + "\n"
+
+
+# Default location of the JSON and feed outputs; git-ignored and uploaded as a
+# workflow artifact so they never show up as README changes
+SUMMARY_OUTPUT_DIR = "summary-output"
+
+
+def build_sinks(output_formats: List[str], repo_owner: str, overview_only: bool = False) -> List[SummarySink]:
+    """Create the output sinks for the requested formats"""
+    sinks = []
+    for output_format in output_formats:
+        if output_format == "markdown":
+            sinks.append(MarkdownSink(overview_only=overview_only))
+        elif output_format == "json":
+            sinks.append(JSONSink(os.getenv("JSON_OUTPUT_PATH", os.path.join(SUMMARY_OUTPUT_DIR, "weekly-summary.json"))))
+        elif output_format == "atom":
+            sinks.append(AtomFeedSink(
+                os.getenv("FEED_OUTPUT_PATH", os.path.join(SUMMARY_OUTPUT_DIR, "weekly-summary.atom")),
+                feed_id=f"https://github.com/{repo_owner}",
+                author=repo_owner
+            ))
+        else:
+            raise ValueError(f"Unknown output format: {output_format}")
+    return sinks
+
+
+def write_summary_outputs(summary_generator: SummaryGenerator, sinks: List[SummarySink]):
+    """Render all sinks in parallel from one shared activity model"""
+    # Aggregate once up front so the sinks only read the shared model
+    summary_generator.build_model()
+    
+    with ThreadPoolExecutor(max_workers=max(len(sinks), 1)) as executor:
+        futures = [executor.submit(sink.render, summary_generator) for sink in sinks]
+        # Write from the main thread, one sink at a time, so status lines never interleave
+        for sink, future in zip(sinks, futures):
+            sink.write(future.result())
+
+
 def main():
     """Main function to run the weekly summary generation"""
     # Get environment variables
@@ -728,6 +1481,10 @@ def main():
     repo_owner = os.getenv("REPO_OWNER")
     repo_name = os.getenv("REPO_NAME")
     check_all_repos = os.getenv("CHECK_ALL_REPOS", "true").lower() == "true"
+    overview_only = os.getenv("OVERVIEW_ONLY", "false").lower() == "true"
+    # Only persisted for local runs; the workflow keeps the cache in memory
+    metadata_cache_path = os.getenv("METADATA_CACHE_PATH")
+    output_formats = [fmt.strip().lower() for fmt in os.getenv("OUTPUT_FORMATS", "markdown").split(",") if fmt.strip()]
     
     if not github_token:
         print("❌ Missing required environment variable: GITHUB_TOKEN")
@@ -737,17 +1494,45 @@ def main():
         print("❌ Missing required environment variable: REPO_OWNER")
         sys.exit(1)
     
+    try:
+        sinks = build_sinks(output_formats, repo_owner, overview_only=overview_only)
+    except ValueError as e:
+        print(f"❌ {e} (supported: markdown, json, atom)")
+        sys.exit(1)
+    
+    try:
+        repo_filter = RepositoryFilter.from_env()
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
+    max_active_repos_env = os.getenv("MAX_ACTIVE_REPOS", "").strip()
+    if max_active_repos_env and not (max_active_repos_env.isdigit() and int(max_active_repos_env) > 0):
+        print(f"❌ MAX_ACTIVE_REPOS must be a positive integer (leave it empty for no limit), got '{max_active_repos_env}'")
+        sys.exit(1)
+    max_active_repos = int(max_active_repos_env) if max_active_repos_env else None
+    
     # Initialize GitHub API client (repo_name can be None if checking all repos)
     if not repo_name:
         repo_name = "placeholder"  # Will be ignored when checking all repos
     
-    github_client = GitHubAPIClient(github_token, repo_owner, repo_name)
+    metadata = RepositoryMetadataCache(metadata_cache_path or None)
+    github_client = GitHubAPIClient(github_token, repo_owner, repo_name, metadata=metadata)
     
     # Get repository activity for the last week
-    if check_all_repos:
+    if overview_only:
+        print(f"🔍 Generating overview totals for {repo_owner if check_all_repos else f'{repo_owner}/{repo_name}'}")
+        if check_all_repos:
+            repository_info = github_client.get_repository_overview(include_private=True)
+        else:
+            repository_info = github_client._get_repository_info()
+        activity_data = {"repository_info": repository_info}
+    elif check_all_repos:
         print(f"🔍 Generating weekly summary for all repositories owned by {repo_owner}")
         print("📊 Fetching activity from all repositories...")
-        activity_data = github_client.get_all_repositories_activity(days=7, include_private=True)
+        activity_data = github_client.get_all_repositories_activity(
+            days=7, include_private=True, repo_filter=repo_filter, max_active_repos=max_active_repos
+        )
     else:
         if not repo_name:
             print("❌ REPO_NAME required when CHECK_ALL_REPOS=false")
@@ -757,9 +1542,10 @@ def main():
         activity_data = github_client.get_repository_activity(days=7)
 
     # Get starred repositories
-    print("⭐ Fetching starred repositories...")
-    starred_repos = github_client._get_starred_repositories(days=30)
-    activity_data["starred_repositories"] = starred_repos
+    if not overview_only:
+        print("⭐ Fetching starred repositories...")
+        starred_repos = github_client._get_starred_repositories(days=30)
+        activity_data["starred_repositories"] = starred_repos
     
     # Extract date range from activity data
     date_range = activity_data.pop("date_range", None)
@@ -767,11 +1553,12 @@ def main():
     # Generate summary
     print("📝 Generating summary...")
     summary_generator = SummaryGenerator(activity_data, date_range=date_range)
-    weekly_summary = summary_generator.generate_weekly_summary()
     
-    # Update README
-    print("📄 Updating README.md...")
-    update_readme_with_summary(weekly_summary)
+    # Render every output format from the same aggregated model
+    print(f"📄 Writing outputs: {', '.join(sink.name for sink in sinks)}...")
+    write_summary_outputs(summary_generator, sinks)
+    
+    metadata.save()
     
     print("🎉 Weekly summary generation completed!")
 